@@ -4,11 +4,56 @@ import threading
 import time
 import sounddevice as sd
 import numpy as np
-import wave
 import os
-import csv
+import json
+import queue
+from collections import deque
 from pynput import keyboard
-from datetime import datetime
+
+# Optional: rtmixer records into a PortAudio ring buffer from C, keeping
+# Python entirely off the real-time audio thread. Fall back to a plain
+# sounddevice callback when it is not installed.
+try:
+    import rtmixer
+except ImportError:
+    rtmixer = None
+
+# Optional: numba compiles the quantize kernel into one SIMD loop instead
+# of separate multiply/clip/cast passes. Fall back to NumPy otherwise.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def quantize(segment, out, scale):
+        """Scale float32 samples into int16 with clamping, in one pass."""
+        for i in range(segment.shape[0]):
+            v = segment[i] * scale
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32767.0:
+                v = -32767.0
+            out[i] = np.int16(v)
+else:
+    def quantize(segment, out, scale):
+        """Scale float32 samples into int16 with clamping (NumPy fallback)."""
+        np.multiply(segment, scale, out=segment)
+        np.clip(segment, -32767.0, 32767.0, out=segment)
+        out[:] = segment
+
+def csv_escape(value):
+    """
+    Quote a CSV field only when it needs it. Metadata fields are under our
+    control, so the common case is a plain passthrough with none of the
+    csv module's per-row quote analysis.
+    """
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if "," in value or "\n" in value or "\r" in value:
+        return '"' + value + '"'
+    return value
 
 class ResearchApp:
     def __init__(self, root):
@@ -18,8 +63,13 @@ class ResearchApp:
 
         # --- Recording duration UI ---
         self.recording_duration = 60  # default seconds
-        self.remaining_time = 0
+        self.stop_time = 0.0  # monotonic deadline for the current recording
         self.timer_running = False
+        # The stop is scheduled once up-front; the label only refreshes
+        # every few seconds instead of waking the Tk loop at 1 Hz.
+        self.timer_interval_ms = 5000
+        self.stop_after_id = None
+        self.timer_after_id = None
         self.duration_var = tk.StringVar(value="60")
         self.timer_label = tk.Label(root, text="", font=("Arial", 12), fg="blue")
         self.timer_label.pack(pady=2)
@@ -43,20 +93,21 @@ class ResearchApp:
         self.segment_duration = 0.2  # seconds per key
         self.buffer_samples = int(self.fs * self.buffer_duration)
         self.segment_samples = int(self.fs * self.segment_duration)
+        # Single-producer (audio callback) / single-consumer (save_key_audio)
+        # ring buffer. No lock: the callback writes samples first and
+        # publishes write_idx last, and the 0.2 s segment read by the
+        # consumer stays well behind the write position in the 2 s ring.
         self.audio_buffer = np.zeros(self.buffer_samples, dtype=np.float32)
-        self.buffer_lock = threading.Lock()
+        self.write_idx = 0  # next write position in the circular buffer
 
-        # Select a valid input device for sounddevice
+        # Select a valid input device for sounddevice. Enumeration can
+        # take 100+ ms on some backends, so it runs on a background
+        # thread (with a small on-disk cache) instead of stalling Tk
+        # startup; start_recording waits briefly for the result.
         self.input_device = None
-        try:
-            devices = sd.query_devices()
-            input_devices = [i for i, d in enumerate(devices) if d['max_input_channels'] > 0]
-            if input_devices:
-                self.input_device = input_devices[0]
-            else:
-                self.input_device = None
-        except Exception as e:
-            self.input_device = None
+        self.device_cache_file = os.path.join(os.path.expanduser("~"), ".kbsound_device_cache.json")
+        self.device_ready = threading.Event()
+        threading.Thread(target=self.probe_devices, daemon=True).start()
 
         # Output directories
         self.output_dir = "recordings"
@@ -65,22 +116,62 @@ class ResearchApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create output directory: {e}")
 
+        # Segments are appended to one packed int16 file with a fixed
+        # stride instead of thousands of tiny WAVs; the metadata CSV holds
+        # each key's row index. Training code loads the whole dataset with
+        # a single open:
+        #   np.memmap("segments.i16", dtype=np.int16, mode="r").reshape(-1, segment_samples)
+        self.segments_file = os.path.join(self.output_dir, "segments.i16")
+        self.segments_fd = None
+        self.segment_count = 0
         self.metadata_file = os.path.join(self.output_dir, "metadata.csv")
-        self.metadata_fields = ["timestamp", "key", "wav_file"]
+        self.metadata_fields = ["timestamp", "key", "segment_index"]
+
+        # Metadata rows are queued in memory as preformatted CSV lines and
+        # flushed in batches through one persistent file handle instead of
+        # an open()/close() per key.
+        self.meta_fp = None
+        self.meta_queue = deque()
 
         # Threads
         self.audio_thread = None
         self.keyboard_thread = None
         self.listener = None
 
+        # Non-printable keys we still record; frozenset for O(1) lookup
+        # on the keyboard hot path.
+        self.allowed_specials = frozenset({"Key.space", "Key.enter", "Key.backspace"})
+
+        # Timestamps keep the %Y%m%d_%H%M%S_%f layout, but the
+        # second-level prefix is cached so most keypresses only format
+        # the microseconds.
+        self.ts_cache_sec = -1
+        self.ts_cache_prefix = ""
+
+        # WAV and metadata writes happen on a dedicated writer thread so
+        # the pynput callback only snapshots the segment and enqueues it.
+        self.save_queue = queue.Queue(maxsize=128)
+        self.save_batch_size = 16
+        # Reusable int16 scratch; safe because only the writer thread
+        # quantizes, one segment at a time.
+        self.seg_i16 = np.empty(self.segment_samples, dtype=np.int16)
+        # Session-wide int16 scale, calibrated from the first keypresses.
+        # Calibration segments are held back and written once the scale is
+        # frozen, so every row in a session shares one scale and relative
+        # key loudness is preserved across the whole dataset.
+        self.calib_segments = 25
+        self.int16_scale = None
+        self.calib_segments_left = self.calib_segments
+        self.calib_pending = []
+        self.session_peak = np.float32(1e-6)
+        self.writer_thread = threading.Thread(target=self.writer_loop, daemon=True)
+        self.writer_thread.start()
+
         # CSV metadata init
-        if not os.path.exists(self.metadata_file):
-            try:
-                with open(self.metadata_file, "w", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=self.metadata_fields)
-                    writer.writeheader()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to initialize metadata file: {e}")
+        try:
+            self.ensure_metadata_schema()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to initialize metadata file: {e}")
 
     def build_duration_selector(self, parent):
         frame = tk.Frame(parent)
@@ -95,6 +186,48 @@ class ResearchApp:
         tk.Label(frame, text="seconds").pack(side=tk.LEFT)
         frame.pack(pady=5)
 
+    def probe_devices(self):
+        """
+        Pick the first input device for recording. The choice is cached on
+        disk keyed by the sounddevice/PortAudio versions, so repeat
+        startups skip device enumeration entirely.
+        """
+        try:
+            cache_key = f"{sd.__version__}/{sd.get_portaudio_version()[0]}"
+            cached_device = None
+            try:
+                with open(self.device_cache_file) as f:
+                    cached = json.load(f)
+                if cached.get("versions") == cache_key:
+                    cached_device = cached.get("input_device")
+            except (OSError, ValueError):
+                pass
+            if cached_device is not None:
+                # Trust the cache only if the index still resolves to an
+                # input device; otherwise fall through to a fresh probe.
+                try:
+                    if sd.query_devices(cached_device)['max_input_channels'] > 0:
+                        self.input_device = cached_device
+                        return
+                except Exception:
+                    pass
+            devices = sd.query_devices()
+            input_devices = [i for i, d in enumerate(devices) if d['max_input_channels'] > 0]
+            if input_devices:
+                self.input_device = input_devices[0]
+                # Cache only successful probes: a launch with no microphone
+                # (or an empty device list from a backend hiccup) must not
+                # stop later launches from probing again.
+                try:
+                    with open(self.device_cache_file, "w") as f:
+                        json.dump({"versions": cache_key, "input_device": self.input_device}, f)
+                except OSError:
+                    pass
+        except Exception:
+            self.input_device = None
+        finally:
+            self.device_ready.set()
+
     def on_duration_change(self, value):
         if value == "Custom":
             self.custom_entry.configure(state=tk.NORMAL)
@@ -116,11 +249,27 @@ class ResearchApp:
         except Exception:
             messagebox.showerror("Error", "Please enter a valid recording duration in seconds.")
             return
-        self.remaining_time = self.recording_duration
+        if not self.device_ready.wait(timeout=1.0):
+            messagebox.showerror("Error", "Audio devices are still being probed; try again in a moment.")
+            return
+        try:
+            self.open_outputs()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open output files: {e}")
+            return
+        # Recalibrate the int16 scale for each recording session
+        self.int16_scale = None
+        self.calib_segments_left = self.calib_segments
+        self.calib_pending = []
+        self.session_peak = np.float32(1e-6)
+        self.stop_time = time.monotonic() + self.recording_duration
         self.update_timer_label()
         self.is_recording = True
         self.timer_running = True
-        self.root.after(1000, self.countdown_timer)
+        # Single scheduled stop; the label refresh re-arms itself at a
+        # low rate and never drives the stop.
+        self.stop_after_id = self.root.after(self.recording_duration * 1000, self.stop_recording)
+        self.timer_after_id = self.root.after(self.timer_interval_ms, self.refresh_timer_label)
         self.status_label.config(text="Status: Recording...")
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
@@ -132,6 +281,12 @@ class ResearchApp:
     def stop_recording(self):
         self.is_recording = False
         self.timer_running = False
+        if self.stop_after_id is not None:
+            self.root.after_cancel(self.stop_after_id)
+            self.stop_after_id = None
+        if self.timer_after_id is not None:
+            self.root.after_cancel(self.timer_after_id)
+            self.timer_after_id = None
         self.timer_label.config(text="")
         self.status_label.config(text="Status: Idle")
         self.start_button.config(state=tk.NORMAL)
@@ -141,46 +296,162 @@ class ResearchApp:
                 self.listener.stop()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to stop keyboard listener: {e}")
+        try:
+            # Let the writer thread finish pending saves before closing
+            self.save_queue.join()
+            self.close_outputs()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to write output files: {e}")
+
+    def ensure_metadata_schema(self):
+        """
+        Create metadata.csv with the current header, moving aside any file
+        that still uses the legacy per-WAV schema (timestamp,key,wav_file)
+        so segment_index rows are never appended under a wav_file header.
+        """
+        header = ",".join(self.metadata_fields)
+        try:
+            with open(self.metadata_file, newline="") as f:
+                existing = f.readline().rstrip("\r\n")
+        except OSError:
+            existing = ""
+        if existing == header:
+            return
+        if existing:
+            # Park the legacy file under a name that is not already taken
+            legacy = os.path.join(self.output_dir, "metadata_legacy.csv")
+            n = 1
+            while os.path.exists(legacy):
+                legacy = os.path.join(self.output_dir, f"metadata_legacy{n}.csv")
+                n += 1
+            os.replace(self.metadata_file, legacy)
+        with open(self.metadata_file, "w", newline="") as f:
+            f.write(header + "\r\n")
+
+    def open_outputs(self):
+        """Open the persistent metadata and packed-segment handles."""
+        if self.meta_fp is None:
+            self.ensure_metadata_schema()
+            self.meta_fp = open(self.metadata_file, "a", newline="", buffering=1 << 16)
+        if self.segments_fd is None:
+            self.segments_fd = os.open(self.segments_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            # Resume indexing after any segments already in the file
+            self.segment_count = os.path.getsize(self.segments_file) // (self.segment_samples * 2)
 
-    def countdown_timer(self):
+    def flush_metadata(self):
+        """Drain queued metadata lines to the CSV in one write call."""
+        if self.meta_fp is None or not self.meta_queue:
+            return
+        rows = []
+        while self.meta_queue:
+            rows.append(self.meta_queue.popleft())
+        self.meta_fp.write("".join(rows))
+
+    def finalize_calibration(self):
+        """
+        Freeze the session scale and write the held-back calibration
+        segments with it, in their original order.
+        """
+        if self.int16_scale is None:
+            self.int16_scale = np.float32(32767.0 / self.session_peak)
+        pending, self.calib_pending = self.calib_pending, []
+        for key_label, timestamp, segment in pending:
+            self.write_key_audio(key_label, timestamp, segment)
+
+    def close_outputs(self):
+        """Flush pending rows and close the metadata and segment handles."""
+        # A session shorter than the calibration window still has segments
+        # held back; freeze the scale from what was seen and write them.
+        # Safe here: save_queue.join() has run, so the writer is idle.
+        if self.calib_pending:
+            self.finalize_calibration()
+        self.flush_metadata()
+        if self.meta_fp is not None:
+            self.meta_fp.close()
+            self.meta_fp = None
+        if self.segments_fd is not None:
+            os.close(self.segments_fd)
+            self.segments_fd = None
+
+    def refresh_timer_label(self):
         if not self.is_recording or not self.timer_running:
             return
-        if self.remaining_time > 0:
-            self.remaining_time -= 1
-            self.update_timer_label()
-            self.root.after(1000, self.countdown_timer)
-        else:
-            self.stop_recording()
+        self.update_timer_label()
+        self.timer_after_id = self.root.after(self.timer_interval_ms, self.refresh_timer_label)
 
     def update_timer_label(self):
-        if self.remaining_time > 0:
-            self.timer_label.config(text=f"Time left: {self.remaining_time} s")
+        remaining = int(round(self.stop_time - time.monotonic()))
+        if remaining > 0:
+            self.timer_label.config(text=f"Time left: {remaining} s")
         else:
             self.timer_label.config(text="")
 
+    def write_samples(self, samples):
+        """
+        Write a block of float32 samples into the circular buffer, wrapping
+        around the end. Samples are written before write_idx is published,
+        so the single consumer never sees a half-written region.
+        """
+        end = self.write_idx + len(samples)
+        if end <= self.buffer_samples:
+            self.audio_buffer[self.write_idx:end] = samples
+        else:
+            split = self.buffer_samples - self.write_idx
+            self.audio_buffer[self.write_idx:] = samples[:split]
+            self.audio_buffer[:end - self.buffer_samples] = samples[split:]
+        self.write_idx = end % self.buffer_samples
+
     def record_audio(self):
         """
-        Continuously record audio into a rolling buffer.
-        Uses a callback to update the buffer with new audio frames.
+        Continuously record audio into the circular buffer.
+        Prefers rtmixer (recording happens in C on the audio thread);
+        otherwise falls back to a Python sounddevice callback.
         """
+        if self.input_device is None:
+            self.root.after(0, self.status_label.config, {"text": "Audio error: No valid input device found"})
+            return
+        if rtmixer is not None:
+            self.record_audio_rtmixer()
+            return
         def callback(indata, frames, time_info, status):
             if not self.is_recording:
                 return
-            with self.buffer_lock:
-                # Rolling buffer: shift left and append new frames
-                self.audio_buffer = np.roll(self.audio_buffer, -frames)
-                self.audio_buffer[-frames:] = indata[:, 0]
+            # RawInputStream hands us a plain CFFI buffer; np.frombuffer
+            # wraps it without copying, so the audio thread skips the
+            # ndarray construction and 2-D indexing InputStream would do.
+            self.write_samples(np.frombuffer(indata, dtype=np.float32, count=frames))
         try:
-            if self.input_device is None:
-                self.root.after(0, self.status_label.config, {"text": "Audio error: No valid input device found"})
-                return
-            with sd.InputStream(device=self.input_device, channels=1, samplerate=self.fs, callback=callback):
+            with sd.RawInputStream(device=self.input_device, channels=1, samplerate=self.fs,
+                                   dtype='float32', blocksize=1024, callback=callback):
                 while self.is_recording:
                     time.sleep(0.05)
         except Exception as e:
             self.root.after(0, self.status_label.config, {"text": f"Audio error: {e}"})
             return
 
+    def record_audio_rtmixer(self):
+        """
+        Record via rtmixer: PortAudio writes into a lock-free C ring buffer
+        with no Python on the audio thread, and this (ordinary) thread
+        drains it into the shared circular buffer.
+        """
+        try:
+            mixer = rtmixer.Recorder(device=self.input_device, channels=1, samplerate=self.fs)
+            # rtmixer ring sizes must be powers of two; round up from our
+            # 2 s buffer. Element size is 4 bytes (mono float32).
+            ring = rtmixer.RingBuffer(4, 1 << (self.buffer_samples - 1).bit_length())
+            with mixer:
+                action = mixer.record_ringbuffer(ring)
+                while self.is_recording:
+                    chunk = np.frombuffer(ring.read(), dtype=np.float32)
+                    if chunk.size:
+                        self.write_samples(chunk)
+                    time.sleep(0.05)
+                mixer.cancel(action)
+        except Exception as e:
+            self.root.after(0, self.status_label.config, {"text": f"Audio error: {e}"})
+            return
+
     def listen_keyboard(self):
         """
         Listen for global keyboard events.
@@ -189,13 +460,16 @@ class ResearchApp:
         def on_press(key):
             if not self.is_recording:
                 return
-            try:
-                k = key.char if hasattr(key, 'char') and key.char else str(key)
-            except Exception:
-                k = str(key)
-            # Only record printable keys and selected controls
-            if (k.isprintable() and len(k) == 1) or k in ['Key.space', 'Key.enter', 'Key.backspace']:
-                self.save_key_audio(k)
+            # Only record printable keys and selected controls. getattr
+            # with a default replaces the hasattr + attribute double
+            # lookup, and str(key) is only computed for special keys.
+            c = getattr(key, 'char', None)
+            if c is not None and len(c) == 1 and c.isprintable():
+                self.save_key_audio(c)
+                return
+            s = str(key)
+            if s in self.allowed_specials:
+                self.save_key_audio(s)
         try:
             self.listener = keyboard.Listener(on_press=on_press)
             self.listener.start()
@@ -206,36 +480,116 @@ class ResearchApp:
 
     def save_key_audio(self, key_label):
         """
-        Extract audio segment from buffer, save as WAV, and log metadata.
-        Ensures output is suitable for ML workflows (spectrograms, CNN, etc.).
+        Snapshot the audio segment for a keypress and hand it to the writer
+        thread. Runs on the keyboard listener thread, so it must not block
+        on disk I/O.
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        wav_filename = f"{key_label}_{timestamp}.wav"
-        wav_path = os.path.join(self.output_dir, wav_filename)
+        timestamp = self.format_timestamp()
+        segment = self.snapshot_segment()
         try:
-            with self.buffer_lock:
-                segment = self.audio_buffer[-self.segment_samples:]
-            # Normalize segment for WAV output
-            if np.max(np.abs(segment)) > 0:
-                segment_int16 = np.int16(segment / np.max(np.abs(segment)) * 32767)
-            else:
-                segment_int16 = np.int16(segment)
-            with wave.open(wav_path, 'w') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(self.fs)
-                wf.writeframes(segment_int16.tobytes())
-            # Write metadata for ML use
-            with open(self.metadata_file, "a", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=self.metadata_fields)
-                writer.writerow({
-                    "timestamp": timestamp,
-                    "key": key_label,
-                    "wav_file": wav_filename
-                })
-        except Exception as e:
-            self.root.after(0, self.status_label.config, {"text": f"Save error: {e}"})
+            self.save_queue.put_nowait((key_label, timestamp, segment))
+        except queue.Full:
+            # Better to drop a key than to stall keyboard event delivery
+            self.root.after(0, self.status_label.config, {"text": "Save error: writer queue full, key dropped"})
+
+    def format_timestamp(self):
+        """
+        Current local time as %Y%m%d_%H%M%S_%f without building a datetime
+        object per call. strftime only runs when the second changes; within
+        a second only the microsecond suffix is formatted.
+        """
+        ns = time.time_ns()
+        sec = ns // 1_000_000_000
+        if sec != self.ts_cache_sec:
+            self.ts_cache_sec = sec
+            self.ts_cache_prefix = time.strftime("%Y%m%d_%H%M%S", time.localtime(sec))
+        return f"{self.ts_cache_prefix}_{(ns % 1_000_000_000) // 1000:06d}"
+
+    def snapshot_segment(self):
+        """
+        Copy the most recent segment_samples out of the ring into a fresh
+        array. The copy is explicit so the audio callback cannot mutate
+        the segment once it is handed to the writer thread, and only the
+        segment is copied rather than unrolling the whole 2 s ring. The
+        segment trails the write position by far more than its own length,
+        so the callback cannot overwrite it mid-copy.
+        """
+        out = np.empty(self.segment_samples, dtype=np.float32)
+        idx = self.write_idx  # read the published index once
+        start = idx - self.segment_samples
+        if start >= 0:
+            np.copyto(out, self.audio_buffer[start:idx])
+        else:
+            # Segment wraps: last -start samples of the ring, then the head
+            np.copyto(out[:-start], self.audio_buffer[start:])
+            np.copyto(out[-start:], self.audio_buffer[:idx])
+        return out
+
+    def writer_loop(self):
+        """
+        Writer thread: drain the save queue and do the segment and metadata
+        writes, absorbing disk latency off the keyboard thread. Bursts of
+        fast typing are drained in batches of up to save_batch_size, with
+        one metadata flush per batch instead of per key.
+        """
+        while True:
+            batch = [self.save_queue.get()]
+            while len(batch) < self.save_batch_size:
+                try:
+                    batch.append(self.save_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for key_label, timestamp, segment in batch:
+                    try:
+                        self.write_key_audio(key_label, timestamp, segment)
+                    except Exception as e:
+                        self.root.after(0, self.status_label.config, {"text": f"Save error: {e}"})
+                self.flush_metadata()
+            except Exception as e:
+                self.root.after(0, self.status_label.config, {"text": f"Save error: {e}"})
+            finally:
+                # task_done must run for every item even if a write blew
+                # up, or stop_recording's save_queue.join() would hang the
+                # main thread forever.
+                for _ in batch:
+                    self.save_queue.task_done()
+
+    def write_key_audio(self, key_label, timestamp, segment):
+        """
+        Append one quantized audio segment to the packed segments file and
+        queue its metadata row. The fixed stride keeps the dataset a single
+        memmap-friendly array for ML workflows (spectrograms, CNN, etc.).
+        """
+        if self.int16_scale is None:
+            # Calibration: track the session peak but hold the segment
+            # back; it is written with the frozen scale below so its
+            # amplitude stays comparable to the rest of the session.
+            peak = np.abs(segment).max()
+            if peak > self.session_peak:
+                self.session_peak = peak
+            self.calib_pending.append((key_label, timestamp, segment))
+            self.calib_segments_left -= 1
+            if self.calib_segments_left <= 0:
+                self.finalize_calibration()
             return
+        # Quantize to int16 with the session scale. The segment array is
+        # owned by this thread once dequeued, so it is scaled in place and
+        # cast into the reused int16 scratch - no per-key allocations. The
+        # clamp keeps keys louder than the calibration peak from wrapping
+        # in the int16 cast.
+        quantize(segment, self.seg_i16, self.int16_scale)
+        # One append per key to the shared fd; .data exposes the sample
+        # buffer directly, avoiding a tobytes copy.
+        os.write(self.segments_fd, self.seg_i16.data)
+        index = self.segment_count
+        self.segment_count += 1
+        # Queue metadata for ML use; the writer loop flushes per batch.
+        # The row is formatted directly - timestamps and indices never
+        # need quoting, and csv_escape covers keys like ',' or '\"'.
+        self.meta_queue.append(
+            f"{timestamp},{csv_escape(key_label)},{index}\r\n"
+        )
 
 if __name__ == "__main__":
     try: